@@ -1052,6 +1052,46 @@ def get_updates_today_by_guild(guild_id: int) -> Dict[str, List[str]]:
         raise DatabaseError(f"Failed to retrieve today's updates: {e}") from e
 
 
+def get_updates_today_by_guilds(guild_ids: List[int]) -> Dict[int, Dict[str, List[str]]]:
+    """Return today's updates for several guilds in one query, grouped by guild then user id."""
+    if not guild_ids:
+        return {}
+
+    try:
+        start_of_day = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        start_ts = int(start_of_day.timestamp())
+        guild_keys = [str(guild_id) for guild_id in guild_ids]
+
+        with _db_manager.get_connection() as conn:
+            if _db_manager._use_postgres or _db_manager._use_mysql:
+                placeholders = ", ".join(["%s"] * len(guild_keys))
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"SELECT guild_id, user_id, update_text FROM progress WHERE guild_id IN ({placeholders}) AND ts>=%s ORDER BY ts DESC",
+                        (*guild_keys, start_ts),
+                    )
+                    rows = cur.fetchall()
+            else:
+                placeholders = ", ".join(["?"] * len(guild_keys))
+                cur = conn.execute(
+                    f"SELECT guild_id, user_id, update_text FROM progress WHERE guild_id IN ({placeholders}) AND ts>=? ORDER BY ts DESC",
+                    (*guild_keys, start_ts),
+                )
+                rows = cur.fetchall()
+
+            updates_by_guild: Dict[int, Dict[str, List[str]]] = {}
+            for row in rows:
+                updates_by_user = updates_by_guild.setdefault(int(row["guild_id"]), {})
+                updates_by_user.setdefault(row["user_id"], []).append(row["update_text"])
+
+            return updates_by_guild
+    except Exception as e:
+        log.error(f"Failed to get today's updates for guilds: {e}")
+        raise DatabaseError(f"Failed to retrieve today's updates: {e}") from e
+
+
 def add_memory(guild_id: int, text: str) -> int:
     """Store a memory snippet for a guild and return its ID."""
     if not text or not text.strip():
@@ -1357,6 +1397,41 @@ def get_edginess(guild_id: int) -> int:
         raise DatabaseError(f"Failed to retrieve edginess: {e}") from e
 
 
+def get_edginess_by_guilds(guild_ids: List[int]) -> Dict[int, int]:
+    """Get edginess levels for several guilds in one query. Missing guilds default to 5."""
+    edginess_by_guild = {guild_id: 5 for guild_id in guild_ids}
+    if not guild_ids:
+        return edginess_by_guild
+
+    try:
+        guild_keys = [str(guild_id) for guild_id in guild_ids]
+        with _db_manager.get_connection() as conn:
+            if _db_manager._use_postgres or _db_manager._use_mysql:
+                placeholders = ", ".join(["%s"] * len(guild_keys))
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"SELECT guild_id, edginess FROM guild_config WHERE guild_id IN ({placeholders})",
+                        tuple(guild_keys),
+                    )
+                    rows = cur.fetchall()
+            else:
+                placeholders = ", ".join(["?"] * len(guild_keys))
+                cur = conn.execute(
+                    f"SELECT guild_id, edginess FROM guild_config WHERE guild_id IN ({placeholders})",
+                    tuple(guild_keys),
+                )
+                rows = cur.fetchall()
+
+            for row in rows:
+                if row["edginess"] is not None:
+                    edginess_by_guild[int(row["guild_id"])] = int(row["edginess"])
+
+            return edginess_by_guild
+    except Exception as e:
+        log.error(f"Failed to get edginess for guilds: {e}")
+        raise DatabaseError(f"Failed to retrieve edginess: {e}") from e
+
+
 def add_achievement(guild_id: int, user_id: int, achievement_type: str, achievement_name: str, progress_text: str, ts: int) -> int:
     """Store a game achievement and return its ID."""
     if not achievement_type or not achievement_name or not progress_text:
@@ -31,7 +31,7 @@ from ai.agents.response_decider import should_respond as agent_should_respond
 from save_parsing.save_parser import (
     parse_hk_save,
     format_save_summary,
-    generate_save_analysis,
+    generate_save_analysis_async,
     SaveDataError,
 )
 from .logger import log
@@ -708,7 +708,7 @@ async def handle_progress_save_data(message: discord.Message, attachment: discor
         formatted_summary = format_save_summary(summary)
         
         # Generate AI analysis
-        analysis = generate_save_analysis(summary)
+        analysis = await generate_save_analysis_async(summary)
         
         # Send the response
         response = f"{formatted_summary}\n\n{analysis}"
@@ -744,7 +744,7 @@ async def handle_save_data(message: discord.Message, attachment: discord.Attachm
         formatted_summary = format_save_summary(summary)
         
         # Generate AI analysis
-        analysis = generate_save_analysis(summary)
+        analysis = await generate_save_analysis_async(summary)
         
         # Send the response
         response = f"{formatted_summary}\n\n{analysis}"
@@ -1558,11 +1558,17 @@ async def recap_tick() -> None:
             return
 
         now = datetime.now(timezone.utc)
+        today = now.date()
         hhmm = now.strftime("%H:%M")
 
+        # Recaps sent on earlier days can never match again; drop them to keep last_sent bounded
+        for stale_guild_id in [gid for gid, sent_on in last_sent.items() if sent_on != today]:
+            del last_sent[stale_guild_id]
+
         guild_configs = database.get_all_guild_configs()
         log.debug(f"Checking {len(guild_configs)} guild configs for recap time {hhmm}")
 
+        due_guilds: List[Tuple[int, int]] = []
         for guild_id, channel_id, recap_time, timezone_str in guild_configs:
             try:
                 if not channel_id or not recap_time:
@@ -1619,11 +1625,26 @@ async def recap_tick() -> None:
                     if recap_time != hhmm:
                         continue
 
-                if last_sent.get(guild_id) == now.date():
+                if last_sent.get(guild_id) == today:
                     continue
 
-                # Get updates for this guild
-                updates = database.get_updates_today_by_guild(int(guild_id))
+                due_guilds.append((guild_id, channel_id))
+
+            except Exception as e:
+                log.error(f"Error processing recap for guild {guild_id}: {e}")
+                continue
+
+        if not due_guilds:
+            return
+
+        # Fetch updates and edginess for every due guild in one query each
+        due_guild_ids = [guild_id for guild_id, _ in due_guilds]
+        updates_by_guild = database.get_updates_today_by_guilds(due_guild_ids)
+        edginess_by_guild = database.get_edginess_by_guilds(due_guild_ids)
+
+        for guild_id, channel_id in due_guilds:
+            try:
+                updates = updates_by_guild.get(guild_id, {})
                 validated_updates = validate_updates_dict(updates)
 
                 if not validated_updates:
@@ -1663,7 +1684,7 @@ async def recap_tick() -> None:
                     }
 
                 # Generate and send summary
-                edginess = database.get_edginess(int(guild_id))
+                edginess = edginess_by_guild.get(guild_id, 5)
                 summary = generate_daily_summary(server_name, pretty, edginess)
 
                 channel = bot.get_channel(int(channel_id))
@@ -1677,7 +1698,7 @@ async def recap_tick() -> None:
                         continue
 
                 await channel.send(summary)
-                last_sent[guild_id] = now.date()
+                last_sent[guild_id] = today
                 log.info(f"Sent daily recap for guild {guild_id}")
 
             except Exception as e:
@@ -1688,9 +1709,13 @@ async def recap_tick() -> None:
         log.error(f"Error in recap_tick: {e}")
 
 
+# BOT_VERSION is constant, so the health check body is encoded once at import
+_HEALTH_BODY = f"HollowBot v{BOT_VERSION} is running! 🎮".encode("utf-8")
+
+
 async def health_check(request):
     """Simple health check endpoint for Render."""
-    return web.Response(text=f"HollowBot v{BOT_VERSION} is running! 🎮", status=200)
+    return web.Response(body=_HEALTH_BODY, status=200, content_type="text/plain", charset="utf-8")
 
 
 async def start_web_server():
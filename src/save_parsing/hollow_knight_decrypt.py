@@ -1,17 +1,20 @@
 """Hollow Knight save file decryption implementation based on bloodorca/hollow."""
 
 import base64
-import struct
 from typing import List, Union
 from Crypto.Cipher import AES
 
 
+# C# BinaryFormatter header that appears at the start of encrypted save files
+CSHARP_HEADER = bytes([0, 1, 0, 0, 0, 255, 255, 255, 255, 1, 0, 0, 0, 0, 0, 0, 0, 6, 1, 0, 0, 0])
+
+
 class HollowKnightDecryptor:
     """Decrypts Hollow Knight save files using the bloodorca/hollow algorithm."""
     
     def __init__(self):
         # C# header that appears at the start of save files
-        self.csharp_header = [0, 1, 0, 0, 0, 255, 255, 255, 255, 1, 0, 0, 0, 0, 0, 0, 0, 6, 1, 0, 0, 0]
+        self.csharp_header = list(CSHARP_HEADER)
         
         # AES key used for encryption/decryption
         self.aes_key = 'UKu52ePUBwetZ9wNX88o54dnfKRu0T1l'.encode('utf-8')
@@ -20,19 +23,19 @@ class HollowKnightDecryptor:
         """Convert string to bytes."""
         return string.encode('utf-8')
     
-    def bytes_to_string(self, bytes_data: bytes) -> str:
+    def bytes_to_string(self, bytes_data: Union[bytes, memoryview]) -> str:
         """Convert bytes to string."""
-        return bytes_data.decode('utf-8')
+        return str(bytes_data, 'utf-8')
     
-    def aes_decrypt(self, encrypted_data: bytes) -> bytes:
+    def aes_decrypt(self, encrypted_data: bytes) -> memoryview:
         """AES decrypt and remove PKCS7 padding."""
         cipher = AES.new(self.aes_key, AES.MODE_ECB)
         decrypted = cipher.decrypt(encrypted_data)
-        # Remove PKCS7 padding
+        # Remove PKCS7 padding with a view so the plaintext is not copied again
         padding_length = decrypted[-1]
-        return decrypted[:-padding_length]
+        return memoryview(decrypted)[:-padding_length]
     
-    def remove_header(self, data: bytes) -> bytes:
+    def remove_header(self, data: Union[bytes, memoryview]) -> Union[bytes, memoryview]:
         """Remove C# header and length prefix from save file."""
         # Remove fixed C# header and ending byte (11)
         data = data[len(self.csharp_header):-1]
@@ -48,8 +51,12 @@ class HollowKnightDecryptor:
     
     def decode(self, encrypted_data: bytes) -> str:
         """Decode Hollow Knight save file to JSON string."""
-        # Make a copy to avoid modifying original
-        data = bytearray(encrypted_data)
+        return self.bytes_to_string(self.decode_bytes(encrypted_data))
+    
+    def decode_bytes(self, encrypted_data: bytes) -> memoryview:
+        """Decode Hollow Knight save file to UTF-8 JSON bytes."""
+        # Work on a read-only view; slicing it never copies the original
+        data = memoryview(encrypted_data)
         
         # Remove header
         data = self.remove_header(data)
@@ -58,13 +65,16 @@ class HollowKnightDecryptor:
         data = base64.b64decode(data)
         
         # AES decrypt
-        data = self.aes_decrypt(data)
-        
-        # Convert to string
-        return self.bytes_to_string(data)
+        return self.aes_decrypt(data)
 
 
 def decrypt_hollow_knight_save(file_content: bytes) -> str:
     """Decrypt a Hollow Knight save file and return the JSON string."""
     decryptor = HollowKnightDecryptor()
     return decryptor.decode(file_content)
+
+
+def decrypt_hollow_knight_save_bytes(file_content: bytes) -> memoryview:
+    """Decrypt a Hollow Knight save file and return the raw JSON bytes."""
+    decryptor = HollowKnightDecryptor()
+    return decryptor.decode_bytes(file_content)
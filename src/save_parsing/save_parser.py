@@ -1,12 +1,231 @@
 """Hollow Knight save data parser for Discord bot."""
 
+import asyncio
+import bisect
+import functools
+import hashlib
 import json
 import io
-from typing import Dict, Any, Optional
+import re
+import sys
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is an optional speedup for the binary fallback scan
+    njit = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson is an optional speedup; its errors subclass json.JSONDecodeError
+    def _json_loads(data):
+        # json.loads takes str or bytes but not the memoryview of decrypted saves
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
 
 from core.logger import log
-from ai.gemini_integration import generate_reply
-from .hollow_knight_decrypt import decrypt_hollow_knight_save
+
+
+# Keywords used by the binary fallback parser
+_SCENE_KEYWORDS = (
+    'Crossroads', 'Greenpath', 'Fungal', 'City', 'Deepnest', 'Crystal',
+    'RestingGrounds', 'Abyss', 'White_Palace',
+)
+_SCENE_RE = re.compile(b'|'.join(re.escape(name.encode('ascii')) for name in _SCENE_KEYWORDS))
+_BINARY_BOSS_NAMES = (
+    'False_Knight', 'Hornet', 'Mantis_Lords', 'Soul_Master', 'Broken_Vessel',
+    'Dung_Defender', 'Crystal_Guardian', 'Uumuu', 'Watcher_Knights',
+    'Hollow_Knight', 'Radiance',
+)
+_BINARY_CHARM_NAMES = (
+    'Wayward_Compass', 'Gathering_Swarm', 'Stalwart_Shell', 'Soul_Catcher',
+    'Shaman_Stone', 'Soul_Eater', 'Dashmaster', 'Sprintmaster', 'Grubsong',
+    'Grubberfly_Elegy',
+)
+# Boss and charm names are matched against the raw bytes in one combined pass,
+# then split by kind. No name contains or overlaps another across the two sets.
+_BINARY_BOSS_KEYS = frozenset(name.encode('ascii') for name in _BINARY_BOSS_NAMES)
+_BINARY_NAME_RE = re.compile(b'|'.join(
+    re.escape(name.encode('ascii')) for name in _BINARY_BOSS_NAMES + _BINARY_CHARM_NAMES
+))
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Field guesses for 4-byte integers in the binary fallback. Within a chain a
+# value goes to the first field that is still unfilled and whose range fits.
+_INT_SCAN_CHAINS = (
+    # 1000..1000000: playtime in seconds (1 hour to 10 days) or geo
+    (("playTime", 3600, 864000), ("geo", 1000, 100000)),
+    # Smaller values
+    (
+        ("health", 1, 9),
+        ("maxHealth", 1, 9),
+        ("deathCount", 0, 999),
+        ("completionPercent", 0, 112),
+        ("nailUpgrades", 0, 4),
+        ("soulVessels", 0, 3),
+        ("maskShards", 0, 4),
+    ),
+)
+# Flattened form of _INT_SCAN_CHAINS for the compiled scan kernel
+_INT_SCAN_FIELDS = tuple(name for chain in _INT_SCAN_CHAINS for name, _, _ in chain)
+_INT_SCAN_LOWS = np.array([low for chain in _INT_SCAN_CHAINS for _, low, _ in chain], dtype=np.int64)
+_INT_SCAN_HIGHS = np.array([high for chain in _INT_SCAN_CHAINS for _, _, high in chain], dtype=np.int64)
+_INT_SCAN_CHAIN_ENDS = np.cumsum([len(chain) for chain in _INT_SCAN_CHAINS]).astype(np.int64)
+# Words checked before falling back to a scan of the whole buffer
+_INT_SCAN_PREFIX_WORDS = 4096
+
+# Death counter field names, in order of preference
+_DEATH_KEYS = ("totalDeaths", "deathCount", "deaths", "deathsCounter")
+
+# Field names that may hold the game/save version
+_VERSION_KEYS = ("version", "gameVersion", "saveVersion", "game_version", "save_version")
+
+# Nail damage -> number of nailsmith upgrades
+_NAIL_UPGRADES_BY_DAMAGE = MappingProxyType({5: 0, 9: 1, 13: 2, 17: 3, 21: 4})
+
+# (playerData flag, display name) pairs for nail arts and abilities
+_NAIL_ARTS_TABLE = (
+    ("hasCyclone", "Cyclone Slash"),
+    ("hasDashSlash", "Dash Slash"),
+    ("hasUpwardSlash", "Great Slash"),
+)
+_ABILITY_TABLE = (
+    ("canDash", "Mothwing Cloak"),
+    ("canWallJump", "Mantis Claw"),
+    ("canSuperDash", "Crystal Heart"),
+    ("canShadowDash", "Shade Cloak"),
+    ("hasDoubleJump", "Monarch Wings"),
+    ("hasDreamNail", "Dream Nail"),
+    ("hasDreamGate", "Dream Gate"),
+    ("hasLantern", "Lumafly Lantern"),
+    ("hasTramPass", "Tram Pass"),
+    ("hasQuill", "Quill"),
+    ("hasCityKey", "City Crest"),
+    ("hasKingsBrand", "King's Brand"),
+)
+
+# (playerData flag, boss name) pairs checked for defeated bosses
+_BOSS_TABLE = (
+    # Main Bosses (each provides 1% completion)
+    ("bossGruzMother", "Gruz Mother"),
+    ("falseKnightDefeated", "False Knight"),
+    ("hornet1Defeated", "Hornet Protector"),
+    ("defeatedDungDefender", "Dung Defender"),
+    ("bossBroodingMawlek", "Brooding Mawlek"),
+    ("mageLordDefeated", "Soul Master"),
+    ("defeatedMantisLords", "Mantis Lords"),
+    ("killedBlackKnight", "Watcher Knights"),
+    ("collectorDefeated", "The Collector"),
+    ("defeatedMegaJelly", "Uumuu"),
+    ("hornetOutskirtsDefeated", "Hornet Sentinel"),
+    ("killedInfectedKnight", "Broken Vessel"),
+    ("killedMimicSpider", "Nosk"),
+    ("killedTraitorLord", "Traitor Lord"),
+    ("killedHollowKnight", "Hollow Knight"),
+
+    # Dream Bosses
+    ("falseKnightDreamDefeated", "Failed Champion"),
+    ("mageLordDreamDefeated", "Soul Tyrant"),
+    ("infectedKnightDreamDefeated", "Lost Kin"),
+    ("whiteDefenderDefeated", "White Defender"),
+    ("greyPrinceDefeated", "Grey Prince Zote"),
+
+    # Warrior Dreams (Essence Bosses)
+    ("aladarSlugDefeated", "Gorb"),
+    ("xeroDefeated", "Xero"),
+    ("mumCaterpillarDefeated", "Marmu"),
+    ("elderHuDefeated", "Elder Hu"),
+    ("noEyesDefeated", "No Eyes"),
+    ("markothDefeated", "Markoth"),
+    ("galienDefeated", "Galien"),
+
+    # Special/Optional Bosses (for 112% completion & achievements)
+    ("killedMegaMossCharger", "Massive Moss Charger"),
+    ("paleLurkerDefeated", "Pale Lurker"),
+
+    # Repeatable Bosses (tracked by amount/max)
+    ("whiteDefenderDefeats", "White Defender (repeatable, up to 5)"),
+    ("greyPrinceDefeats", "Grey Prince Zote (repeatable, up to 10)"),
+)
+
+# Charm names indexed by charm id - 1, as used by gotCharm_N and equippedCharms
+_CHARM_NAMES = (
+    "Gathering Swarm", "Wayward Compass", "Grubsong", "Stalwart Shell",
+    "Baldur Shell", "Fury of the Fallen", "Quick Focus", "Lifeblood Heart",
+    "Lifeblood Core", "Defender's Crest", "Flukenest", "Thorns of Agony",
+    "Mark of Pride", "Steady Body", "Heavy Blow", "Sharp Shadow",
+    "Spore Shroom", "Longnail", "Shaman Stone", "Soul Catcher", "Soul Eater",
+    "Glowing Womb", "Fragile Heart", "Fragile Greed", "Fragile Strength",
+    "Nailmaster's Glory", "Joni's Blessing", "Shape of Unn", "Hiveblood",
+    "Dream Wielder", "Dashmaster", "Quick Slash", "Spell Twister",
+    "Deep Focus", "Grubberfly's Elegy", "Kingsoul", "Sprintmaster",
+    "Dreamshield", "Weaversong", "Grimmchild",
+)
+# Same names indexed directly by charm id; index 0 is an unused sentinel
+_CHARM_NAME_BY_ID = ("",) + _CHARM_NAMES
+# Built keys are not interned automatically like the literal flags elsewhere
+_OWNED_CHARM_KEYS = tuple(
+    (sys.intern(f"gotCharm_{charm_id}"), name) for charm_id, name in enumerate(_CHARM_NAMES, 1)
+)
+
+# playerData flag -> (category, table position, display name) across the owned
+# charm, boss, ability and nail art tables, so one pass over playerData finds
+# them all. Categories index the tuple returned by _classify_flags.
+_FLAG_TO_CATEGORY = MappingProxyType({
+    flag: (category, position, name)
+    for category, table in enumerate((_OWNED_CHARM_KEYS, _BOSS_TABLE, _ABILITY_TABLE, _NAIL_ARTS_TABLE))
+    for position, (flag, name) in enumerate(table)
+})
+_FLAG_KEYS = frozenset(_FLAG_TO_CATEGORY)
+
+# Progress stages by completion percentage: _STAGES[i] applies below
+# _STAGE_THRESHOLDS[i], the last entry from 100% up. Each entry is
+# (emoji, stage line, journey line) as shown in format_save_summary.
+_FRESH_STAGE = ("🌱", "Fresh save detected!", "Hallownest journey is just beginning!")
+_STAGE_THRESHOLDS = (20, 50, 80, 100)
+_STAGES = tuple(
+    (emoji, f"**Stage**: {stage}", f"Hallownest journey: {stage}")
+    for stage, emoji in (
+        ("Early Game", "🌱"),
+        ("Mid Game", "⚔️"),
+        ("Late Game", "🔥"),
+        ("End Game", "👑"),
+        ("112% Complete", "🏆"),
+    )
+)
+
+# Key layout of parse_hk_save summaries. Fields that are always 0 are filled
+# in here; the rest are computed per save.
+_SUMMARY_TEMPLATE = dict.fromkeys((
+    "playtime_hours", "playtime_seconds", "completion_percent",
+    "completion_per_hour", "geo", "health", "max_health", "deaths", "scene",
+    "zone", "soul_vessels", "total_soul_vessels", "mask_shards",
+    "charms_owned", "charms_owned_actual", "charms_equipped", "charm_slots",
+    "charm_slots_filled", "bosses_defeated", "bosses_defeated_actual",
+    "bosses_defeated_list", "bosses_defeated_list_actual", "charms_list",
+    "nail_damage", "nail_upgrades", "nail_arts", "abilities",
+    "grubs_collected", "journal_entries", "journal_total", "scenes_visited",
+    "scenes_mapped", "save_version", "path_of_pain_completed",
+))
+_SUMMARY_TEMPLATE.update({"soul_vessels": 0, "bosses_defeated": 0})
+
+# Precomputed emoji rows for the stat bars in format_save_summary
+_HEART_ROWS = tuple("❤️" * count for count in range(21))
+_SOUL_ROWS = tuple("💙" * count for count in range(21))
+_NOTCH_ROWS = tuple("🔸" * count for count in range(21))
+
+# Parsed summaries keyed by a digest of the uploaded file, most recent last
+_SUMMARY_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_SUMMARY_CACHE_SIZE = 64
 
 
 class SaveDataError(Exception):
@@ -26,18 +245,49 @@ def parse_hk_save(file_content: bytes) -> Dict[str, Any]:
     Raises:
         SaveDataError: If parsing fails
     """
+    # Re-uploads of the same file skip decryption and parsing entirely
+    key = hashlib.blake2b(file_content, digest_size=16).digest()
+    cached = _SUMMARY_CACHE.get(key)
+    if cached is not None:
+        _SUMMARY_CACHE.move_to_end(key)
+        return cached.copy()
+    
+    summary = _parse_hk_save(file_content)
+    _SUMMARY_CACHE[key] = summary
+    if len(_SUMMARY_CACHE) > _SUMMARY_CACHE_SIZE:
+        _SUMMARY_CACHE.popitem(last=False)
+    return summary.copy()
+
+
+def _parse_hk_save(file_content: bytes) -> Dict[str, Any]:
+    """Parse save data without consulting the summary cache."""
     try:
-        # Check if it's already JSON (converted file)
-        try:
-            content_str = file_content.decode('utf-8')
-            raw = json.loads(content_str)
-        except (UnicodeDecodeError, json.JSONDecodeError):
+        raw = None
+        # Check if it's already JSON (converted file). Only those start with '{',
+        # so binary saves skip the full-buffer decode attempt.
+        if file_content[:1] == b'{':
+            try:
+                raw = _json_loads(file_content)
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                pass
+        
+        if raw is None:
             # It's a binary .dat file - try to decrypt it first
+            # Imported here so JSON uploads never load the AES backend
+            from .hollow_knight_decrypt import CSHARP_HEADER, decrypt_hollow_knight_save_bytes
             try:
-                decrypted_json = decrypt_hollow_knight_save(file_content)
-                raw = json.loads(decrypted_json)
-            except Exception as decrypt_error:
+                # Hand the decrypted bytes straight to the JSON parser,
+                # skipping an intermediate str
+                decrypted_json = decrypt_hollow_knight_save_bytes(file_content)
+                raw = _json_loads(decrypted_json)
+            except (ValueError, IndexError) as decrypt_error:
+                # Bad base64, block size, padding or JSON all raise ValueError
+                # subclasses; a truncated header raises IndexError
                 log.warning(f"Failed to decrypt save file: {decrypt_error}")
+                # An encrypted save that won't decrypt has no readable data,
+                # so the binary scan would only produce defaults
+                if file_content.startswith(CSHARP_HEADER):
+                    raise SaveDataError(f"Failed to decrypt save file: {decrypt_error}")
                 # Fall back to binary parsing
                 raw = _convert_binary_save_to_json(file_content)
         
@@ -48,70 +298,99 @@ def parse_hk_save(file_content: bytes) -> Dict[str, Any]:
         log.debug(f"Available root fields: {list(raw.keys())}")
         log.debug(f"Available playerData fields: {list(pd.keys())}")
         
-        # Extract key progress information
-        playtime_hours = round(pd.get("playTime", 0) / 3600, 2)
-        completion_percent = pd.get("completionPercentage", pd.get("completionPercent", 0))
-        completion_per_hour = round(completion_percent / playtime_hours, 2) if playtime_hours > 0 else 0
-        
-        deaths = (
-            pd.get("totalDeaths")
-            or pd.get("deathCount")
-            or pd.get("deaths")
-            or pd.get("deathsCounter")
-            or 0
-        )
-
-        total_soul_vessels = _calculate_soul_vessels(pd)
-        extra_soul_vessels = max(total_soul_vessels - 3, 0)
-
-        owned_charms = _get_owned_charms_list(pd)
-        equipped_charms = _get_equipped_charms_list(pd)
-        bosses_defeated_list_actual = _get_defeated_bosses_list(pd)
-        bosses_defeated_actual = len(bosses_defeated_list_actual)
-
-        summary = {
-            "playtime_hours": playtime_hours,
-            "playtime_seconds": pd.get("playTime", 0),
-            "completion_percent": completion_percent,
-            "completion_per_hour": completion_per_hour,
-            "geo": pd.get("geo", 0),
-            "health": pd.get("health", 0),
-            "max_health": pd.get("maxHealth", 0),
-            "deaths": int(deaths) if isinstance(deaths, (int, float)) else 0,
-            "scene": pd.get("respawnScene", "Unknown"),
-            "zone": pd.get("mapZone", "Unknown"),
-            "soul_vessels": 0,
-            "total_soul_vessels": total_soul_vessels,
-            "mask_shards": pd.get("heartPieces", 0),
-            "charms_owned": len(owned_charms),
-            "charms_owned_actual": pd.get("charmsOwned", len(owned_charms)),
-            "charms_equipped": equipped_charms,
-            "charm_slots": pd.get("charmSlots", 0),
-            "charm_slots_filled": pd.get("charmSlotsFilled", 0),
-            "bosses_defeated": 0,
-            "bosses_defeated_actual": bosses_defeated_actual,
-            "bosses_defeated_list": [],
-            "bosses_defeated_list_actual": bosses_defeated_list_actual,
-            "charms_list": owned_charms,
-            "nail_damage": pd.get("nailDamage", 5),
-            "nail_upgrades": _calculate_nail_upgrades(pd),
-            "nail_arts": _get_nail_arts_list(pd),
-            "abilities": _get_abilities_list(pd),
-            "grubs_collected": pd.get("grubsCollected", 0),
-            "journal_entries": pd.get("journalEntriesCompleted", 0),
-            "journal_total": pd.get("journalEntriesTotal", 146),
-            "scenes_visited": len(pd.get("scenesVisited", [])),
-            "scenes_mapped": len(pd.get("scenesMapped", [])),
-            "save_version": _get_save_version(raw, pd),
-            "path_of_pain_completed": "Yes" if pd.get("killedBindingSeal", 0) else "No",
-        }
+        if isinstance(pd, dict) and not pd:
+            # Nothing to extract; only the root can still carry a version
+            summary = _EMPTY_SUMMARY.copy()
+            for key in _SUMMARY_LIST_FIELDS:
+                summary[key] = []
+            summary["save_version"] = _get_save_version(raw, pd)
+            return summary
         
-        return summary
+        return _build_summary(raw, pd)
         
+    except SaveDataError:
+        raise
     except Exception as e:
         raise SaveDataError(f"Failed to parse save file: {e}")
 
 
+def _build_summary(raw: Dict[str, Any], pd: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a parse_hk_save summary from decoded save data."""
+    # Literal keys are interned by the compiler; binding get saves an
+    # attribute lookup per field
+    get = pd.get
+    playtime_seconds = get("playTime", 0)
+    playtime_hours = round(playtime_seconds / 3600, 2)
+    completion_percent = get("completionPercentage", get("completionPercent", 0))
+    completion_per_hour = round(completion_percent / playtime_hours, 2) if playtime_hours > 0 else 0
+    
+    # First key present wins, so a recorded 0 is not mistaken for "missing"
+    for key in _DEATH_KEYS:
+        if key in pd:
+            deaths = pd[key]
+            break
+    else:
+        deaths = 0
+
+    total_soul_vessels = _calculate_soul_vessels(pd)
+    extra_soul_vessels = max(total_soul_vessels - 3, 0)
+
+    owned_charms, bosses_defeated_list_actual, abilities, nail_arts = _classify_flags(pd)
+    bosses_defeated_actual = len(bosses_defeated_list_actual)
+    equipped_charms = [
+        _CHARM_NAME_BY_ID[charm_id]
+        for charm_id in get("equippedCharms", ())
+        if isinstance(charm_id, int) and 0 < charm_id < len(_CHARM_NAME_BY_ID)
+    ]
+
+    # Nail upgrades: the nailsmith counter if present, else derived from damage
+    nail_damage = get("nailDamage", 5)
+    smith_upgrades = get("nailSmithUpgrades")
+    if isinstance(smith_upgrades, (int, float)):
+        nail_upgrades = int(smith_upgrades)
+    else:
+        nail_upgrades = _NAIL_UPGRADES_BY_DAMAGE.get(nail_damage, 0)
+
+    # Start from the template so the key order and fixed fields come for free
+    summary = _SUMMARY_TEMPLATE.copy()
+    summary.update({
+        "playtime_hours": playtime_hours,
+        "playtime_seconds": playtime_seconds,
+        "completion_percent": completion_percent,
+        "completion_per_hour": completion_per_hour,
+        "geo": get("geo", 0),
+        "health": get("health", 0),
+        "max_health": get("maxHealth", 0),
+        "deaths": int(deaths) if isinstance(deaths, (int, float)) else 0,
+        "scene": get("respawnScene", "Unknown"),
+        "zone": get("mapZone", "Unknown"),
+        "total_soul_vessels": total_soul_vessels,
+        "mask_shards": get("heartPieces", 0),
+        "charms_owned": len(owned_charms),
+        "charms_owned_actual": get("charmsOwned", len(owned_charms)),
+        "charms_equipped": equipped_charms,
+        "charm_slots": get("charmSlots", 0),
+        "charm_slots_filled": get("charmSlotsFilled", 0),
+        "bosses_defeated_actual": bosses_defeated_actual,
+        "bosses_defeated_list": [],
+        "bosses_defeated_list_actual": bosses_defeated_list_actual,
+        "charms_list": owned_charms,
+        "nail_damage": nail_damage,
+        "nail_upgrades": nail_upgrades,
+        "nail_arts": nail_arts,
+        "abilities": abilities,
+        "grubs_collected": get("grubsCollected", 0),
+        "journal_entries": get("journalEntriesCompleted", 0),
+        "journal_total": get("journalEntriesTotal", 146),
+        "scenes_visited": len(get("scenesVisited", ())),
+        "scenes_mapped": len(get("scenesMapped", ())),
+        "save_version": _get_save_version(raw, pd),
+        "path_of_pain_completed": "Yes" if get("killedBindingSeal", 0) else "No",
+    })
+    
+    return summary
+
+
 def _calculate_soul_vessels(pd: Dict[str, Any]) -> int:
     """Calculate the number of soul vessels from save data."""
     # First, try to get the direct soul vessel count
@@ -137,270 +416,34 @@ def _calculate_soul_vessels(pd: Dict[str, Any]) -> int:
 
 def _get_save_version(raw: Dict[str, Any], pd: Dict[str, Any]) -> str:
     """Get save version from various possible locations in the save file."""
-    # Try different possible field names for version
-    version_fields = [
-        raw.get("version"),
-        raw.get("gameVersion"), 
-        raw.get("saveVersion"),
-        raw.get("game_version"),
-        raw.get("save_version"),
-        pd.get("version"),
-        pd.get("gameVersion"),
-        pd.get("saveVersion"),
-        pd.get("game_version"),
-        pd.get("save_version")
-    ]
-    
-    for version in version_fields:
-        if version and version != "Unknown":
-            return str(version)
+    # Root fields take precedence over playerData; stop at the first usable one
+    for source in (raw, pd):
+        for field in _VERSION_KEYS:
+            version = source.get(field)
+            if version and version != "Unknown":
+                return str(version)
     
     return "Unknown"
 
 
-def _calculate_nail_upgrades(pd: Dict[str, Any]) -> int:
-    """Calculate nail upgrade level from nail damage."""
-    smith_upgrades = pd.get("nailSmithUpgrades")
-    if isinstance(smith_upgrades, (int, float)):
-        return int(smith_upgrades)
-
-    damage_mapping = {5: 0, 9: 1, 13: 2, 17: 3, 21: 4}
-    nail_damage = pd.get("nailDamage", 5)
-    return damage_mapping.get(nail_damage, 0)
-
-
-def _get_nail_arts_list(pd: Dict[str, Any]) -> list:
-    """Get list of learned nail arts."""
-    nail_arts = []
-    if pd.get("hasCyclone", False):
-        nail_arts.append("Cyclone Slash")
-    if pd.get("hasDashSlash", False):
-        nail_arts.append("Dash Slash")
-    if pd.get("hasUpwardSlash", False):
-        nail_arts.append("Great Slash")
-    return nail_arts
-
-
-def _get_abilities_list(pd: Dict[str, Any]) -> list:
-    """Get list of acquired abilities."""
-    abilities = []
-    if pd.get("canDash", False):
-        abilities.append("Mothwing Cloak")
-    if pd.get("canWallJump", False):
-        abilities.append("Mantis Claw")
-    if pd.get("canSuperDash", False):
-        abilities.append("Crystal Heart")
-    if pd.get("canShadowDash", False):
-        abilities.append("Shade Cloak")
-    if pd.get("hasDoubleJump", False):
-        abilities.append("Monarch Wings")
-    if pd.get("hasDreamNail", False):
-        abilities.append("Dream Nail")
-    if pd.get("hasDreamGate", False):
-        abilities.append("Dream Gate")
-    if pd.get("hasLantern", False):
-        abilities.append("Lumafly Lantern")
-    if pd.get("hasTramPass", False):
-        abilities.append("Tram Pass")
-    if pd.get("hasQuill", False):
-        abilities.append("Quill")
-    if pd.get("hasCityKey", False):
-        abilities.append("City Crest")
-    if pd.get("hasKingsBrand", False):
-        abilities.append("King's Brand")
-    return abilities
-
-
-def _count_defeated_bosses(pd: Dict[str, Any]) -> int:
-    """Count the number of defeated bosses from player data."""
-    boss_flags = [
-        # Main Bosses (each provides 1% completion)
-        "bossGruzMother", "falseKnightDefeated", "hornet1Defeated", "defeatedDungDefender", 
-        "bossBroodingMawlek", "mageLordDefeated", "defeatedMantisLords", "killedBlackKnight", 
-        "collectorDefeated", "defeatedMegaJelly", "hornetOutskirtsDefeated", "killedInfectedKnight", 
-        "killedMimicSpider", "killedTraitorLord", "killedHollowKnight",
-        
-        # Dream Bosses
-        "falseKnightDreamDefeated", "mageLordDreamDefeated", "infectedKnightDreamDefeated",
-        "whiteDefenderDefeated", "greyPrinceDefeated",
-        
-        # Warrior Dreams (Essence Bosses)
-        "aladarSlugDefeated", "xeroDefeated", "mumCaterpillarDefeated", "elderHuDefeated",
-        "noEyesDefeated", "markothDefeated", "galienDefeated",
-        
-        # Special/Optional Bosses (for 112% completion & achievements)
-        "killedMegaMossCharger", "paleLurkerDefeated",
-        
-        # Repeatable Bosses (tracked by amount/max)
-        "whiteDefenderDefeats", "greyPrinceDefeats"
-    ]
-    
-    count = 0
-    for flag in boss_flags:
-        if pd.get(flag, False):
-            count += 1
-    
-    return count
-
-
-def _get_defeated_bosses_list(pd: Dict[str, Any]) -> list:
-    """Get list of defeated boss names."""
-    boss_mapping = {
-        # Main Bosses (each provides 1% completion)
-        "bossGruzMother": "Gruz Mother",
-        "falseKnightDefeated": "False Knight",
-        "hornet1Defeated": "Hornet Protector",
-        "defeatedDungDefender": "Dung Defender",
-        "bossBroodingMawlek": "Brooding Mawlek",
-        "mageLordDefeated": "Soul Master",
-        "defeatedMantisLords": "Mantis Lords",
-        "killedBlackKnight": "Watcher Knights",
-        "collectorDefeated": "The Collector",
-        "defeatedMegaJelly": "Uumuu",
-        "hornetOutskirtsDefeated": "Hornet Sentinel",
-        "killedInfectedKnight": "Broken Vessel",
-        "killedMimicSpider": "Nosk",
-        "killedTraitorLord": "Traitor Lord",
-        "killedHollowKnight": "Hollow Knight",
-        
-        # Dream Bosses
-        "falseKnightDreamDefeated": "Failed Champion",
-        "mageLordDreamDefeated": "Soul Tyrant",
-        "infectedKnightDreamDefeated": "Lost Kin",
-        "whiteDefenderDefeated": "White Defender",
-        "greyPrinceDefeated": "Grey Prince Zote",
-        
-        # Warrior Dreams (Essence Bosses)
-        "aladarSlugDefeated": "Gorb",
-        "xeroDefeated": "Xero",
-        "mumCaterpillarDefeated": "Marmu",
-        "elderHuDefeated": "Elder Hu",
-        "noEyesDefeated": "No Eyes",
-        "markothDefeated": "Markoth",
-        "galienDefeated": "Galien",
-        
-        # Special/Optional Bosses (for 112% completion & achievements)
-        "killedMegaMossCharger": "Massive Moss Charger",
-        "paleLurkerDefeated": "Pale Lurker",
-        
-        # Repeatable Bosses (tracked by amount/max)
-        "whiteDefenderDefeats": "White Defender (repeatable, up to 5)",
-        "greyPrinceDefeats": "Grey Prince Zote (repeatable, up to 10)"
-    }
+def _classify_flags(pd: Dict[str, Any]) -> Tuple[list, list, list, list]:
+    """Get owned charms, defeated bosses, abilities and nail arts in one pass.
     
-    defeated = []
-    for flag, name in boss_mapping.items():
-        if pd.get(flag, False):
-            defeated.append(name)
-    
-    return defeated
-
-
-def _get_owned_charms_list(pd: Dict[str, Any]) -> list:
-    """Get list of owned charm names."""
-    charm_mapping = {
-        1: "Gathering Swarm",
-        2: "Wayward Compass", 
-        3: "Grubsong",
-        4: "Stalwart Shell",
-        5: "Baldur Shell",
-        6: "Fury of the Fallen",
-        7: "Quick Focus",
-        8: "Lifeblood Heart",
-        9: "Lifeblood Core",
-        10: "Defender's Crest",
-        11: "Flukenest",
-        12: "Thorns of Agony",
-        13: "Mark of Pride",
-        14: "Steady Body",
-        15: "Heavy Blow",
-        16: "Sharp Shadow",
-        17: "Spore Shroom",
-        18: "Longnail",
-        19: "Shaman Stone",
-        20: "Soul Catcher",
-        21: "Soul Eater",
-        22: "Glowing Womb",
-        23: "Fragile Heart",
-        24: "Fragile Greed",
-        25: "Fragile Strength",
-        26: "Nailmaster's Glory",
-        27: "Joni's Blessing",
-        28: "Shape of Unn",
-        29: "Hiveblood",
-        30: "Dream Wielder",
-        31: "Dashmaster",
-        32: "Quick Slash",
-        33: "Spell Twister",
-        34: "Deep Focus",
-        35: "Grubberfly's Elegy",
-        36: "Kingsoul",
-        37: "Sprintmaster",
-        38: "Dreamshield",
-        39: "Weaversong",
-        40: "Grimmchild"
-    }
-    
-    owned = []
-    for charm_id, name in charm_mapping.items():
-        if pd.get(f"gotCharm_{charm_id}", False):
-            owned.append(name)
-    
-    return owned
-
-
-def _get_equipped_charms_list(pd: Dict[str, Any]) -> list:
-    """Get list of currently equipped charm names."""
-    charm_mapping = {
-        1: "Gathering Swarm",
-        2: "Wayward Compass", 
-        3: "Grubsong",
-        4: "Stalwart Shell",
-        5: "Baldur Shell",
-        6: "Fury of the Fallen",
-        7: "Quick Focus",
-        8: "Lifeblood Heart",
-        9: "Lifeblood Core",
-        10: "Defender's Crest",
-        11: "Flukenest",
-        12: "Thorns of Agony",
-        13: "Mark of Pride",
-        14: "Steady Body",
-        15: "Heavy Blow",
-        16: "Sharp Shadow",
-        17: "Spore Shroom",
-        18: "Longnail",
-        19: "Shaman Stone",
-        20: "Soul Catcher",
-        21: "Soul Eater",
-        22: "Glowing Womb",
-        23: "Fragile Heart",
-        24: "Fragile Greed",
-        25: "Fragile Strength",
-        26: "Nailmaster's Glory",
-        27: "Joni's Blessing",
-        28: "Shape of Unn",
-        29: "Hiveblood",
-        30: "Dream Wielder",
-        31: "Dashmaster",
-        32: "Quick Slash",
-        33: "Spell Twister",
-        34: "Deep Focus",
-        35: "Grubberfly's Elegy",
-        36: "Kingsoul",
-        37: "Sprintmaster",
-        38: "Dreamshield",
-        39: "Weaversong",
-        40: "Grimmchild"
-    }
-    
-    equipped = []
-    equipped_ids = pd.get("equippedCharms", [])
-    for charm_id in equipped_ids:
-        if charm_id in charm_mapping:
-            equipped.append(charm_mapping[charm_id])
-    
-    return equipped
+    Each list keeps the order of its table, not the order of playerData.
+    """
+    buckets = ([], [], [], [])
+    # Set intersection runs in C and leaves only the known flags to check
+    for flag in pd.keys() & _FLAG_KEYS:
+        if pd[flag]:
+            category, position, name = _FLAG_TO_CATEGORY[flag]
+            buckets[category].append((position, name))
+    return tuple([name for _, name in sorted(bucket)] for bucket in buckets)
+
+
+# Summary of a save with an empty playerData, built once at import. The list
+# fields are replaced with fresh lists for each returned copy.
+_EMPTY_SUMMARY = MappingProxyType(_build_summary({}, {}))
+_SUMMARY_LIST_FIELDS = tuple(key for key, value in _EMPTY_SUMMARY.items() if isinstance(value, list))
 
 
 def _convert_binary_save_to_json(file_content: bytes) -> Dict[str, Any]:
@@ -413,106 +456,45 @@ def _convert_binary_save_to_json(file_content: bytes) -> Dict[str, Any]:
     try:
         data = file_content
         
-        # Extract readable strings from the binary data
-        text_parts = []
-        current_text = ""
-        
-        for byte in data:
-            if 32 <= byte <= 126:  # Printable ASCII
-                current_text += chr(byte)
-            else:
-                if len(current_text) > 3:  # Keep shorter strings too
-                    text_parts.append(current_text)
-                current_text = ""
-        
-        # First, try to find embedded JSON in the binary data
-        try:
-            # Look for the JSON string directly in the binary data
-            content_str = file_content.decode('utf-8', errors='ignore')
-            if 'playerData' in content_str and '{' in content_str:
-                # Find the start of the JSON
-                start = content_str.find('{')
+        # First, try to find embedded JSON in the binary data. The bytes check
+        # is a cheap C-level scan that skips the decode for most binary files.
+        if b'playerData' in file_content:
+            try:
+                # Look for the JSON string directly in the binary data. '{' is
+                # ASCII, so only the bytes from the first brace need decoding.
+                start = file_content.find(b'{')
                 if start != -1:
-                    # Find the matching closing brace
-                    brace_count = 0
-                    end = start
-                    for i, char in enumerate(content_str[start:], start):
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                end = i + 1
-                                break
-                    
-                    json_str = content_str[start:end]
-                    parsed = json.loads(json_str)
+                    # Decode through a memoryview slice so the tail is not copied first
+                    content_str = str(memoryview(file_content)[start:], 'utf-8', 'ignore')
+                    # raw_decode does the brace matching in C and ignores trailing bytes
+                    parsed, _end = _JSON_DECODER.raw_decode(content_str)
                     if 'playerData' in parsed:
                         return parsed
-        except:
-            pass
+            except (ValueError, RecursionError):
+                # No complete JSON object after the brace
+                pass
         
         # If no JSON found, try to extract actual values from the binary data
         player_data = {}
         
-        # Look for common Hollow Knight data patterns
-        for i, text in enumerate(text_parts):
-            # Look for scene names (common patterns)
-            if any(scene in text for scene in ['Crossroads', 'Greenpath', 'Fungal', 'City', 'Deepnest', 'Crystal', 'RestingGrounds', 'Abyss', 'White_Palace']):
-                if 'respawnScene' not in player_data:
-                    player_data['respawnScene'] = text
-                if 'mapZone' not in player_data:
-                    # Extract zone from scene name
-                    zone = text.split('_')[0] if '_' in text else text
-                    player_data['mapZone'] = zone
+        # Look for scene names (common patterns); the scene is the whole
+        # printable run around the first keyword hit
+        scene_match = _SCENE_RE.search(data)
+        if scene_match:
+            scene = _printable_run_around(data, scene_match.start(), scene_match.end())
+            player_data['respawnScene'] = scene
+            # Extract zone from scene name
+            player_data['mapZone'] = scene.split('_')[0]
         
         # Try to extract numeric values from the binary data
         # Look for patterns that might be playtime, geo, etc.
-        import struct
-        
-        # Look for 4-byte integers that might be meaningful values
-        for i in range(0, len(data) - 4, 4):
-            try:
-                # Try little-endian 32-bit integer
-                value = struct.unpack('<I', data[i:i+4])[0]
-                
-                # Reasonable ranges for Hollow Knight values
-                if 1000 <= value <= 1000000:  # Could be playtime in seconds or geo
-                    if 'playTime' not in player_data and 3600 <= value <= 864000:  # 1 hour to 10 days
-                        player_data['playTime'] = value
-                    elif 'geo' not in player_data and 0 <= value <= 100000:
-                        player_data['geo'] = value
-                elif 0 <= value <= 1000:  # Smaller values
-                    if 'health' not in player_data and 1 <= value <= 9:
-                        player_data['health'] = value
-                    elif 'maxHealth' not in player_data and 1 <= value <= 9:
-                        player_data['maxHealth'] = value
-                    elif 'deathCount' not in player_data and 0 <= value <= 1000:
-                        player_data['deathCount'] = value
-                    elif 'completionPercent' not in player_data and 0 <= value <= 112:
-                        player_data['completionPercent'] = value
-                    elif 'nailUpgrades' not in player_data and 0 <= value <= 4:
-                        player_data['nailUpgrades'] = value
-                    elif 'soulVessels' not in player_data and 0 <= value <= 3:
-                        player_data['soulVessels'] = value
-                    elif 'maskShards' not in player_data and 0 <= value <= 4:
-                        player_data['maskShards'] = value
-            except:
-                continue
+        player_data.update(_scan_binary_ints(data))
         
-        # Look for boss names in the text parts
+        # Look for boss and charm names, deduplicated in order of appearance
         bosses = []
         charms = []
-        boss_names = ['False_Knight', 'Hornet', 'Mantis_Lords', 'Soul_Master', 'Broken_Vessel', 'Dung_Defender', 'Crystal_Guardian', 'Uumuu', 'Watcher_Knights', 'Hollow_Knight', 'Radiance']
-        charm_names = ['Wayward_Compass', 'Gathering_Swarm', 'Stalwart_Shell', 'Soul_Catcher', 'Shaman_Stone', 'Soul_Eater', 'Dashmaster', 'Sprintmaster', 'Grubsong', 'Grubberfly_Elegy']
-        
-        for text in text_parts:
-            for boss in boss_names:
-                if boss in text and boss not in bosses:
-                    bosses.append(boss)
-            for charm in charm_names:
-                if charm in text and charm not in charms:
-                    charms.append(charm)
+        for name in dict.fromkeys(_BINARY_NAME_RE.findall(data)):
+            (bosses if name in _BINARY_BOSS_KEYS else charms).append(name.decode('ascii'))
         
         player_data['bossesDefeated'] = bosses
         player_data['charms'] = charms
@@ -542,141 +524,232 @@ def _convert_binary_save_to_json(file_content: bytes) -> Dict[str, Any]:
         raise SaveDataError(f"Failed to convert binary save file: {e}")
 
 
+def _printable_run_around(data: bytes, start: int, end: int) -> str:
+    """Widen ``data[start:end]`` to the surrounding run of printable ASCII."""
+    while start > 0 and 32 <= data[start - 1] <= 126:
+        start -= 1
+    while end < len(data) and 32 <= data[end] <= 126:
+        end += 1
+    return data[start:end].decode('ascii')
+
+
+def _first_scan_hits(values, lows, highs, chain_ends):
+    """Return the index of the word that fills each scan field, or -1.
+    
+    Walks the words once; each word fills the first free field in each chain
+    whose range it falls in.
+    """
+    hits = np.full(lows.shape[0], -1, np.int64)
+    remaining = lows.shape[0]
+    for i in range(values.shape[0]):
+        value = values[i]
+        start = 0
+        for end in chain_ends:
+            for field in range(start, end):
+                if hits[field] == -1 and lows[field] <= value <= highs[field]:
+                    hits[field] = i
+                    remaining -= 1
+                    break
+            start = end
+        if remaining == 0:
+            break
+    return hits
+
+
+if njit is not None:
+    _first_scan_hits = njit(cache=True)(_first_scan_hits)
+
+
+def _scan_binary_ints(data: bytes) -> Dict[str, int]:
+    """Guess numeric player fields from aligned little-endian 32-bit words.
+    
+    Equivalent to walking the words in order and filling the first free field
+    of each chain. Uses the compiled kernel when Numba is installed and NumPy
+    masks otherwise, never a Python loop over the words.
+    """
+    # Words start at every offset i with i < len(data) - 4
+    count = max(len(data) - 1, 0) // 4
+    values = np.frombuffer(data, dtype='<u4', count=count)
+    
+    if njit is not None:
+        hits = _first_scan_hits(values, _INT_SCAN_LOWS, _INT_SCAN_HIGHS, _INT_SCAN_CHAIN_ENDS)
+        return {
+            name: int(values[hit])
+            for name, hit in zip(_INT_SCAN_FIELDS, hits)
+            if hit >= 0
+        }
+    
+    # Fills depend only on earlier words, so if a short prefix fills every
+    # field the rest of the buffer cannot change the result
+    found = _mask_scan(values[:_INT_SCAN_PREFIX_WORDS])
+    if len(found) < len(_INT_SCAN_FIELDS) and count > _INT_SCAN_PREFIX_WORDS:
+        found = _mask_scan(values)
+    return found
+
+
+def _mask_scan(values: np.ndarray) -> Dict[str, int]:
+    """Resolve the scan field chains over ``values`` with boolean masks."""
+    count = values.size
+    positions = np.arange(count)
+    found = {}
+    for chain in _INT_SCAN_CHAINS:
+        earlier = []
+        for name, low, high in chain:
+            in_range = (values >= low) & (values <= high)
+            candidates = in_range
+            # A word only reaches this field if every earlier field either
+            # rejects it or was already filled by a previous word
+            for earlier_range, filled_at in earlier:
+                candidates = candidates & (~earlier_range | (positions > filled_at))
+            hits = np.flatnonzero(candidates)
+            if hits.size:
+                filled_at = hits[0]
+                found[name] = int(values[filled_at])
+            else:
+                filled_at = count
+            earlier.append((in_range, filled_at))
+    
+    return found
+
+
+def _emoji_row(rows: tuple, count: int) -> str:
+    """Return ``count`` copies of an emoji, using the precomputed rows when possible."""
+    if 0 <= count < len(rows):
+        return rows[count]
+    return rows[1] * count
+
+
 def format_save_summary(summary: Dict[str, Any]) -> str:
-    """Format the save data summary into a Discord-friendly message."""
+    """Format the save data summary into a Discord-friendly message.
+    
+    Expects a summary as returned by ``parse_hk_save``; list fields such as
+    the defeated bosses and equipped charms must already be lists.
+    """
+    get = summary.get
     completion = summary["completion_percent"]
     
-    # Determine progress stage
+    # Determine progress stage and its precomputed message lines
     if completion == 0:
-        stage = "Fresh Save"
-        emoji = "🌱"
-    elif completion < 20:
-        stage = "Early Game"
-        emoji = "🌱"
-    elif completion < 50:
-        stage = "Mid Game"
-        emoji = "⚔️"
-    elif completion < 80:
-        stage = "Late Game"
-        emoji = "🔥"
-    elif completion < 100:
-        stage = "End Game"
-        emoji = "👑"
+        emoji, stage_line, journey_line = _FRESH_STAGE
     else:
-        stage = "112% Complete"
-        emoji = "🏆"
+        emoji, stage_line, journey_line = _STAGES[bisect.bisect_right(_STAGE_THRESHOLDS, completion)]
     
     # Format playtime
-    playtime_seconds = summary.get('playtime_seconds', 0)
-    hours = int(playtime_seconds // 3600)
-    minutes = int((playtime_seconds % 3600) // 60)
-    seconds = int(playtime_seconds % 60)
-    playtime_formatted = f"{hours} h {minutes:02d} min {seconds:02d} sec"
-    playtime_hours = summary.get('playtime_hours', 0)
-
-    # Stage messaging
-    if completion == 0:
-        stage_line = "Fresh save detected!"
-        journey_line = "Hallownest journey is just beginning!"
-    else:
-        stage_line = f"**Stage**: {stage}"
-        journey_line = f"Hallownest journey: {stage}"
+    playtime_seconds = get('playtime_seconds', 0)
+    total_minutes, seconds = divmod(playtime_seconds, 60)
+    hours, minutes = divmod(total_minutes, 60)
+    playtime_formatted = f"{int(hours)} h {int(minutes):02d} min {int(seconds):02d} sec"
+    playtime_hours = get('playtime_hours', 0)
 
     # Health display with mask images - cleaner format
-    health_masks = "❤️" * summary['max_health']
-    health_text = f"{health_masks} ({summary['max_health']})"
+    max_health = summary['max_health']
+    health_text = f"{_emoji_row(_HEART_ROWS, max_health)} ({max_health})"
     
     # Soul display with orb images - cleaner format
-    total_vessels = summary.get('total_soul_vessels')
+    total_vessels = get('total_soul_vessels')
     if total_vessels is None:
-        extra_vessels = summary.get('soul_vessels', 0)
+        extra_vessels = get('soul_vessels', 0)
         total_vessels = extra_vessels + 3 if extra_vessels else extra_vessels
     if not total_vessels:
         total_vessels = 3  # Base number of vessels
-    soul_orbs = "💙" * total_vessels
-    soul_text = f"{soul_orbs} ({total_vessels})"
+    soul_text = f"{_emoji_row(_SOUL_ROWS, total_vessels)} ({total_vessels})"
     
     # Notches display - cleaner format
-    notches = "🔸" * summary.get('charm_slots', 0)
-    notches_text = f"{notches} ({summary.get('charm_slots', 0)})"
+    charm_slots = get('charm_slots', 0)
+    notches_text = f"{_emoji_row(_NOTCH_ROWS, charm_slots)} ({charm_slots})"
     
-    # Bosses list
-    bosses_text = ""
-    bosses_defeated_list = summary.get('bosses_defeated_list_actual', summary.get('bosses_defeated_list')) or []
-    if isinstance(bosses_defeated_list, str):
-        try:
-            bosses_defeated_list = json.loads(bosses_defeated_list)
-        except json.JSONDecodeError:
-            bosses_defeated_list = []
+    bosses_defeated_list = get('bosses_defeated_list_actual', get('bosses_defeated_list')) or []
+    nail_arts = get('nail_arts')
+    abilities = get('abilities')
+    charms_equipped = get('charms_equipped') or []
+    bosses_defeated_count = get('bosses_defeated_actual', get('bosses_defeated', 0))
+
+    # Build the message line by line and join once at the end
+    parts = [
+        f"🎮 **Hollow Knight Progress Analysis** {emoji}",
+        "",
+        stage_line,
+        journey_line,
+        "",
+        f"**Health**: {health_text}",
+        f"**Soul**: {soul_text}",
+        f"**Notches**: {notches_text}",
+        f"**Geo**: 💰 {summary['geo']:,}",
+        f"**Playtime**: ⏱️ {playtime_formatted} ({playtime_hours:.2f} hours)",
+        f"**Game Completion**: 📊 {completion}% (out of 112%) - {get('completion_per_hour', 0)}%/hr",
+        f"**Deaths**: 💀 {get('deaths', 0)} | 👹 Bosses defeated: {bosses_defeated_count}",
+        f"**Save Version**: 📝 {get('save_version', 'Unknown')}",
+        "",
+        f"**Nail**: ⚔️ +{get('nail_upgrades', 0)} upgrades ({get('nail_damage', 5)} damage)",
+    ]
+    if nail_arts:
+        parts.append(f"**Nail Arts**: {', '.join(nail_arts)}")
+    parts.append(f"**Charms**: 🎭 {summary['charms_owned']} owned")
     if bosses_defeated_list:
-        bosses_text = f"**Bosses Defeated**: {', '.join(bosses_defeated_list)}\n"
-    
-    # Nail arts
-    nail_arts_text = ""
-    if summary.get('nail_arts'):
-        nail_arts_text = f"**Nail Arts**: {', '.join(summary['nail_arts'])}\n"
-    
-    # Abilities
-    abilities_text = ""
-    if summary.get('abilities'):
-        abilities_text = f"**Abilities**: {', '.join(summary['abilities'])}\n"
-    
-    # Equipment (charms equipped)
-    equipment_text = ""
-    charms_equipped = summary.get('charms_equipped') or []
-    if isinstance(charms_equipped, str):
-        try:
-            charms_equipped = json.loads(charms_equipped)
-        except json.JSONDecodeError:
-            charms_equipped = []
+        parts.append(f"**Bosses Defeated**: {', '.join(bosses_defeated_list)}")
+    if abilities:
+        parts.append(f"**Abilities**: {', '.join(abilities)}")
     if charms_equipped:
-        equipment_text = f"**Equipment**: {', '.join(charms_equipped)}\n"
-
-    bosses_defeated_count = summary.get('bosses_defeated_actual', summary.get('bosses_defeated', 0))
-
-    message = f"""🎮 **Hollow Knight Progress Analysis** {emoji}
-
-{stage_line}
-{journey_line}
-
-**Health**: {health_text}
-**Soul**: {soul_text}
-**Notches**: {notches_text}
-**Geo**: 💰 {summary['geo']:,}
-**Playtime**: ⏱️ {playtime_formatted} ({playtime_hours:.2f} hours)
-**Game Completion**: 📊 {completion}% (out of 112%) - {summary.get('completion_per_hour', 0)}%/hr
-**Deaths**: 💀 {summary.get('deaths', 0)} | 👹 Bosses defeated: {bosses_defeated_count}
-**Save Version**: 📝 {summary.get('save_version', 'Unknown')}
-
-**Nail**: ⚔️ +{summary.get('nail_upgrades', 0)} upgrades ({summary.get('nail_damage', 5)} damage)
-{nail_arts_text}**Charms**: 🎭 {summary['charms_owned']} owned
-{bosses_text}{abilities_text}{equipment_text}
-**Collectibles**: 🐛 {summary.get('grubs_collected', 0)} grubs, 📖 {summary.get('journal_entries', 0)}/{summary.get('journal_total', 146)} journal entries
-**Exploration**: 🗺️ {summary.get('scenes_visited', 0)} scenes visited, {summary.get('scenes_mapped', 0)} mapped
-**Path of Pain Completed**: 💔 {summary.get('path_of_pain_completed', 0)}
-
-📍 **Current Location**: {summary['scene']} ({summary['zone']})"""
+        parts.append(f"**Equipment**: {', '.join(charms_equipped)}")
+    parts += [
+        "",
+        f"**Collectibles**: 🐛 {get('grubs_collected', 0)} grubs, 📖 {get('journal_entries', 0)}/{get('journal_total', 146)} journal entries",
+        f"**Exploration**: 🗺️ {get('scenes_visited', 0)} scenes visited, {get('scenes_mapped', 0)} mapped",
+        f"**Path of Pain Completed**: 💔 {get('path_of_pain_completed', 0)}",
+        "",
+        f"📍 **Current Location**: {summary['scene']} ({summary['zone']})",
+    ]
     
-    return message
+    return "\n".join(parts)
 
 
 def generate_save_analysis(summary: Dict[str, Any]) -> str:
     """Generate AI analysis of the save data."""
     try:
-        prompt = f"""You are HollowBot, a seasoned Hollow Knight player who's 112% the game.
+        # Re-uploads of the same save reuse the cached reply instead of calling Gemini again
+        return _generate_save_analysis_cached(
+            summary['playtime_hours'],
+            summary['completion_percent'],
+            summary['scene'],
+            summary['zone'],
+            summary['bosses_defeated'],
+            summary['charms_owned'],
+        )
+        
+    except Exception as e:
+        log.error(f"Failed to generate save analysis: {e}")
+        return "The Chronicler had trouble analyzing your save data, but I can see you're making progress!"
+
+
+async def generate_save_analysis_async(summary: Dict[str, Any]) -> str:
+    """Generate AI analysis of the save data without blocking the event loop."""
+    # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, generate_save_analysis, summary)
+
+
+@functools.lru_cache(maxsize=256)
+def _generate_save_analysis_cached(
+    playtime_hours: float,
+    completion_percent: float,
+    scene: str,
+    zone: str,
+    bosses_defeated: int,
+    charms_owned: int,
+) -> str:
+    """Build the analysis prompt from the summary fingerprint and ask Gemini."""
+    prompt = f"""You are HollowBot, a seasoned Hollow Knight player who's 112% the game.
 Analyze this save data and give a short, personalized response (1-2 sentences max):
 
-Playtime: {summary['playtime_hours']} hours
-Completion: {summary['completion_percent']}%
-Location: {summary['scene']} ({summary['zone']})
-Bosses defeated: {summary['bosses_defeated']}
-Charms owned: {summary['charms_owned']}
+Playtime: {playtime_hours} hours
+Completion: {completion_percent}%
+Location: {scene} ({zone})
+Bosses defeated: {bosses_defeated}
+Charms owned: {charms_owned}
 
 Give a gamer-style response about their progress. Be encouraging but playfully snarky. 
 Do NOT include 'HollowBot:' or any name prefix in your response."""
-        
-        return generate_reply(prompt)
-        
-    except Exception as e:
-        log.error(f"Failed to generate save analysis: {e}")
-        return "The Chronicler had trouble analyzing your save data, but I can see you're making progress!"
+    
+    # Imported here so parsing saves does not pull in the Gemini client
+    from ai.gemini_integration import generate_reply
+    return generate_reply(prompt)
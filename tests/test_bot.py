@@ -1,24 +1,36 @@
 #!/usr/bin/env python3
 """Simple test script to verify bot components work."""
 
+import importlib
 import os
 import sys
+import time
+from types import SimpleNamespace
+
 import pytest
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# Set up environment for testing before any bot module reads its config
+os.environ["DISCORD_TOKEN"] = "dummy"
+os.environ["GEMINI_API_KEY"] = "dummy"
 
-def test_imports():
-    """Test that all modules can be imported."""
-    os.environ["DISCORD_TOKEN"] = "dummy"
-    os.environ["GEMINI_API_KEY"] = "dummy"
+from core import config, logger, validation, database
+from core import main as bot_main
+from core.validation import (
+    validate_progress_text,
+    validate_time_format,
+    validate_custom_context,
+    ValidationError,
+)
+from ai import gemini_integration
+from langchain.chains import ConversationChain
+from langchain.memory import ConversationBufferMemory
 
-    from core import config, logger, validation, database
-    from ai import gemini_integration
-    from langchain.chains import ConversationChain
-    from langchain.memory import ConversationBufferMemory
 
+def test_imports():
+    """Test that all modules can be imported."""
     assert config is not None
     assert logger is not None
     assert validation is not None
@@ -32,23 +44,14 @@ def test_config():
     os.environ["DISCORD_TOKEN"] = "dummy-discord-token"
     os.environ["GEMINI_API_KEY"] = "dummy-key-for-testing"
 
-    import importlib
-    from core import config as config_module
-    importlib.reload(config_module)
+    importlib.reload(config)
 
-    assert config_module.config.discord_token == "dummy-discord-token"
-    assert config_module.config.google_api_key == "dummy-key-for-testing"
+    assert config.config.discord_token == "dummy-discord-token"
+    assert config.config.google_api_key == "dummy-key-for-testing"
 
 
 def test_validation():
     """Test validation functions."""
-    from core.validation import (
-        validate_progress_text,
-        validate_time_format,
-        validate_custom_context,
-        ValidationError,
-    )
-
     # Test valid inputs
     assert validate_progress_text("Beat the Mantis Lords!")
     assert validate_time_format("18:30") == "18:30"
@@ -65,8 +68,6 @@ def test_validation():
 
 def test_memory_db():
     """Test memory database operations."""
-    from core import database
-
     mem_id = database.add_memory(1, "Test memory")
     memories = database.get_memories_by_guild(1)
     assert any(mid == mem_id for mid, _ in memories)
@@ -75,9 +76,6 @@ def test_memory_db():
 
 def test_leaderboard_db():
     """Test leaderboard database operations."""
-    from core import database
-    import time
-
     test_guild_id = 999
     test_user_id = 888
     current_time = int(time.time())
@@ -97,21 +95,32 @@ def test_leaderboard_db():
     assert recent_updates >= 1
 
 
+def test_bulk_guild_queries_db():
+    """Test batched per-guild lookups used by the daily recap."""
+    current_time = int(time.time())
+    database.add_update(777, 666, "Beat Hornet", current_time)
+    database.add_update(778, 665, "Got Mantis Claw", current_time)
+    database.set_edginess(777, 9)
+
+    updates = database.get_updates_today_by_guilds([777, 778, 779])
+    assert "Beat Hornet" in updates[777]["666"]
+    assert "Got Mantis Claw" in updates[778]["665"]
+    assert 779 not in updates
+
+    edginess = database.get_edginess_by_guilds([777, 779])
+    assert edginess == {777: 9, 779: 5}
+    assert database.get_updates_today_by_guilds([]) == {}
+
+
 def test_command_structure():
     """Test that the new command structure is properly defined."""
-    from core import main
-
-    assert main.BOT_VERSION == "3.3"
-    assert hasattr(main, 'bot')
-    assert hasattr(main, 'hollow_group')
+    assert bot_main.BOT_VERSION == "3.3"
+    assert hasattr(bot_main, 'bot')
+    assert hasattr(bot_main, 'hollow_group')
 
 
 def test_bot_only_reacts_to_direct_mentions():
     """Ensure mention detection only triggers for the HollowBot account."""
-    from types import SimpleNamespace
-
-    from core import main
-
     bot_user = SimpleNamespace(id=1234)
 
     message_with_other_mentions = SimpleNamespace(
@@ -126,34 +135,28 @@ def test_bot_only_reacts_to_direct_mentions():
         content=f"<@{bot_user.id}> fight!",
     )
 
-    assert not main._is_bot_mentioned(message_with_other_mentions, bot_user)
-    assert main._is_bot_mentioned(message_with_bot_mention, bot_user)
+    assert not bot_main._is_bot_mentioned(message_with_other_mentions, bot_user)
+    assert bot_main._is_bot_mentioned(message_with_bot_mention, bot_user)
 
 
 def test_strip_bot_mention_preserves_other_mentions():
     """Ensure we only remove the bot mention token and keep other mentions intact."""
-    from types import SimpleNamespace
-
-    from core import main
-
     bot_user = SimpleNamespace(id=1234)
     other_user_id = 4321
 
     content = f"<@{bot_user.id}> fight <@{other_user_id}>"
-    cleaned = main._strip_bot_mention(content, bot_user)
+    cleaned = bot_main._strip_bot_mention(content, bot_user)
 
     assert cleaned == f"fight <@{other_user_id}>"
 
     content_with_bang = f"<@!{bot_user.id}>   hello"
-    cleaned_with_bang = main._strip_bot_mention(content_with_bang, bot_user)
+    cleaned_with_bang = bot_main._strip_bot_mention(content_with_bang, bot_user)
 
     assert cleaned_with_bang == "hello"
 
 
 def test_leaderboard_algorithm():
     """Test the leaderboard scoring algorithm."""
-    import time
-
     def calculate_score(user_id: str, total_updates: int, days_active: int, recent_updates: int, first_update_ts: int) -> float:
         base_score = total_updates * 10
         days_since_first = (int(time.time()) - first_update_ts) // 86400
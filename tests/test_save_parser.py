@@ -129,6 +129,55 @@ class TestSaveFileParsing:
         assert summary['bosses_defeated_list'] == []
         assert summary['charms_list'] == []
     
+    def test_zero_deaths_is_not_skipped(self):
+        """Test that a recorded 0 deaths wins over later fallback fields."""
+        content = json.dumps({"playerData": {"totalDeaths": 0, "deathCount": 12}}).encode()
+        
+        summary = parse_hk_save(content)
+        
+        assert summary['deaths'] == 0
+
+    def test_flag_lists_keep_table_order(self):
+        """Test that flag-derived lists follow table order, not playerData order."""
+        content = json.dumps({"playerData": {
+            "gotCharm_40": True, "hornet1Defeated": True, "hasDreamNail": True,
+            "gotCharm_2": True, "falseKnightDefeated": True, "canDash": True,
+            "gotCharm_3": False, "hasCyclone": True,
+        }}).encode()
+
+        summary = parse_hk_save(content)
+
+        assert summary['charms_list'] == ["Wayward Compass", "Grimmchild"]
+        assert summary['bosses_defeated_list_actual'] == ["False Knight", "Hornet Protector"]
+        assert summary['abilities'] == ["Mothwing Cloak", "Dream Nail"]
+        assert summary['nail_arts'] == ["Cyclone Slash"]
+
+    def test_empty_player_data_summary(self):
+        """Test that an empty playerData still yields a full summary with fresh lists."""
+        first = parse_hk_save(json.dumps({"playerData": {}, "version": "1.5.78"}).encode())
+        second = parse_hk_save(json.dumps({"playerData": {}}).encode())
+        
+        assert first['save_version'] == "1.5.78"
+        assert second['save_version'] == "Unknown"
+        assert first['soul_vessels'] == 0 and first['nail_damage'] == 5
+        assert first['charms_list'] == [] and first['charms_list'] is not second['charms_list']
+
+    def test_repeat_upload_uses_summary_cache(self):
+        """Test that parsing the same bytes twice reuses the cached summary."""
+        from unittest.mock import patch
+        from save_parsing import save_parser
+
+        content = json.dumps({"playerData": {"geo": 4321}}).encode()
+        save_parser._SUMMARY_CACHE.clear()
+
+        with patch.object(save_parser, '_parse_hk_save', wraps=save_parser._parse_hk_save) as mock_parse:
+            first = parse_hk_save(content)
+            first['geo'] = 0
+            second = parse_hk_save(bytes(content))
+
+        assert second['geo'] == 4321
+        mock_parse.assert_called_once()
+
     def test_save_file_decryption(self, fresh_save_file):
         """Test that save files are properly decrypted."""
         if not os.path.exists(fresh_save_file):
@@ -223,6 +272,28 @@ class TestSaveSummaryFormatting:
         assert "55%" in formatted  # Completion
         assert "27" in formatted  # Deaths
 
+    
+    @pytest.mark.parametrize("completion, stage", [
+        (1, "Early Game"),
+        (20, "Mid Game"),
+        (50, "Late Game"),
+        (80, "End Game"),
+        (100, "112% Complete"),
+    ])
+    def test_stage_boundaries(self, completion, stage):
+        """Test that each completion threshold maps to the right stage."""
+        summary = {
+            'completion_percent': completion,
+            'max_health': 5,
+            'geo': 0,
+            'charms_owned': 0,
+            'scene': 'Town',
+            'zone': 'TOWN',
+        }
+        
+        formatted = format_save_summary(summary)
+        
+        assert f"**Stage**: {stage}" in formatted
 
 class TestSaveAnalysis:
     """Test AI-powered save analysis."""
@@ -267,6 +338,55 @@ class TestSaveAnalysis:
         assert len(analysis) > 50  # Should have substantial analysis
         # Note: We can't test specific content since it's AI-generated
 
+    
+    def test_analysis_is_cached_per_fingerprint(self):
+        """Test that identical summaries reuse the previous analysis."""
+        from unittest.mock import patch
+        from save_parsing import save_parser
+        
+        summary = {
+            'playtime_hours': 1.5,
+            'completion_percent': 12,
+            'scene': 'Crossroads_01',
+            'zone': 'CROSSROADS',
+            'bosses_defeated': 1,
+            'charms_owned': 2,
+        }
+        save_parser._generate_save_analysis_cached.cache_clear()
+        
+        with patch('ai.gemini_integration.generate_reply', return_value="Nice run, gamer.") as mock_reply:
+            first = generate_save_analysis(summary)
+            second = generate_save_analysis(dict(summary))
+        
+        assert first == second == "Nice run, gamer."
+        mock_reply.assert_called_once()
+
+    def test_async_analysis_runs_off_the_event_loop(self):
+        """Test that the async wrapper returns the same analysis from a worker thread."""
+        import asyncio
+        import threading
+        from unittest.mock import patch
+        from save_parsing.save_parser import generate_save_analysis_async
+        
+        summary = {
+            'playtime_hours': 2.0,
+            'completion_percent': 30,
+            'scene': 'Fungus1_01',
+            'zone': 'GREEN_PATH',
+            'bosses_defeated': 2,
+            'charms_owned': 3,
+        }
+        calling_threads = []
+        
+        def fake_reply(prompt):
+            calling_threads.append(threading.current_thread())
+            return "Greenpath suits you."
+        
+        with patch('ai.gemini_integration.generate_reply', side_effect=fake_reply):
+            analysis = asyncio.run(generate_save_analysis_async(summary))
+        
+        assert analysis == "Greenpath suits you."
+        assert calling_threads and calling_threads[0] is not threading.main_thread()
 
 class TestErrorHandling:
     """Test error handling for invalid files."""
@@ -298,6 +418,32 @@ class TestErrorHandling:
         assert isinstance(summary, dict)
         assert 'playtime_hours' in summary
 
+    
+    def test_undecryptable_encrypted_save(self):
+        """Test that an encrypted save that fails to decrypt raises instead of returning defaults."""
+        decryptor = HollowKnightDecryptor()
+        broken_save = bytes(decryptor.csharp_header) + b"\x10not-base64!!" + b"\x0b"
+        
+        with pytest.raises(SaveDataError):
+            parse_hk_save(broken_save)
+
+    def test_binary_int_scan_paths_agree(self, monkeypatch):
+        """Test that the compiled scan and the NumPy fallback pick the same fields."""
+        from save_parsing import save_parser
+        import struct
+
+        words = [5, 7200, 50000, 4, 900000, 300, 12, 2, 3600, 80, 1, 0, 3, 9]
+        data = b"".join(struct.pack("<I", word) for word in words) + b"\x00"
+
+        compiled = save_parser._scan_binary_ints(data)
+        monkeypatch.setattr(save_parser, "njit", None)
+        fallback = save_parser._scan_binary_ints(data)
+
+        assert compiled == fallback == {
+            "health": 5, "playTime": 7200, "geo": 50000, "maxHealth": 4,
+            "deathCount": 300, "completionPercent": 12, "nailUpgrades": 2,
+            "soulVessels": 1, "maskShards": 0,
+        }
 
 class TestFileSizeValidation:
     """Test file size validation."""